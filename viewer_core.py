@@ -0,0 +1,573 @@
+from PyQt5.QtWidgets import QApplication, QLabel, QMainWindow, QVBoxLayout, QPushButton, QLineEdit, QWidget, QSizePolicy, QSlider, QGraphicsView, QGraphicsScene, QGraphicsPixmapItem
+from PyQt5.QtGui import QPixmap, QImage, QImageReader, QGuiApplication, QIcon, QFont, QFontDatabase, QPalette, QColor
+from PyQt5.QtCore import Qt, QSize, QByteArray, QUrl, QTimer, QBuffer, QIODevice, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+import sys
+from io import BytesIO
+from urllib.parse import urlsplit
+import os
+from dataclasses import dataclass, field
+from typing import Optional
+
+# Clipboard text is treated as an image URL when its path ends with one of these
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".bmp")
+
+USER_AGENT = "4REF/1.0"
+
+# Downloads are aborted after this long without any data arriving
+TRANSFER_TIMEOUT_MS = 30000
+
+# URL downloads first fetch only PREVIEW_BYTES; files over PREVIEW_THRESHOLD are shown
+# from that partial data, when it decodes, while the rest of the file downloads
+PREVIEW_BYTES = 512 * 1024
+PREVIEW_THRESHOLD = 2 * 1024 * 1024
+
+# Capacity kept reserved in the download buffer, which is reused across loads
+DOWNLOAD_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Optional: Pillow downscales large images faster than QPixmap.scaled. Pillow-SIMD is
+# a drop-in replacement that is faster still with AVX2 (install it in place of Pillow:
+#   pip uninstall pillow && CC="cc -mavx2" pip install -U --force-reinstall pillow-simd)
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Image modes that Pillow converts to 8-bit RGB(A) without losing range
+PILLOW_MODES = {"RGB", "RGBA", "L", "LA", "P", "PA", "1", "CMYK", "YCbCr"}
+
+def decode_image(source, max_size=(800, 800)):
+    """Decode image bytes or a file path into a QImage, capping it to max_size with Pillow when available."""
+    # Let the decoder skip pixels we would throw away: JPEGs can be decoded at 1/2, 1/4
+    # or 1/8 scale almost for free. Stay at twice max_size so the final cap is still smooth.
+    bound = (max_size[0] * 2, max_size[1] * 2)
+    if Image is not None:
+        try:
+            pil = Image.open(source if isinstance(source, str) else BytesIO(bytes(source)))
+            # Other modes (16-bit and float images) would be clipped by convert(), so those
+            # are left to Qt's decoders, which scale them down to 8 bits properly
+            if pil.mode in PILLOW_MODES:
+                pil.draft(None, bound)
+                if pil.mode != "RGB":
+                    pil = pil.convert("RGBA")
+                pil.thumbnail(max_size, Image.BICUBIC)
+                if pil.mode == "RGB":
+                    fmt = QImage.Format_RGB888
+                else:
+                    fmt = QImage.Format_RGBA8888
+                data = pil.tobytes("raw", pil.mode)
+                # QImage does not own the buffer, so copy before `data` goes away
+                return QImage(data, pil.width, pil.height, pil.width * len(pil.mode), fmt).copy()
+        except (OSError, ValueError, Image.DecompressionBombError):
+            # Formats Pillow can't read (e.g. SVG), and images too large for it to open,
+            # fall back to Qt's decoders, which downscale while reading
+            pass
+    if isinstance(source, str):
+        reader = QImageReader(source)
+    else:
+        buffer = QBuffer()
+        buffer.setData(source)
+        buffer.open(QIODevice.ReadOnly)
+        reader = QImageReader(buffer)
+    size = reader.size()
+    if size.width() > bound[0] or size.height() > bound[1]:
+        reader.setScaledSize(size.scaled(QSize(*bound), Qt.KeepAspectRatio))
+    return reader.read()
+
+def content_range_total(reply):
+    """Return the full file size from a 206 reply's Content-Range header, or None if unknown."""
+    total = bytes(reply.rawHeader(b"Content-Range")).decode("latin-1").rpartition("/")[2]
+    return int(total) if total.isdigit() else None
+
+# UI assets are decoded once per process and shared by every viewer window
+_PIXMAP_CACHE = {}
+_ICON_CACHE = {}
+
+def cached_pixmap(path):
+    """Return the QPixmap for path, decoding the file only on first use."""
+    pixmap = _PIXMAP_CACHE.get(path)
+    if pixmap is None:
+        pixmap = _PIXMAP_CACHE[path] = QPixmap(path)
+    return pixmap
+
+def cached_icon(path):
+    """Return the QIcon for path, loading the file only on first use."""
+    icon = _ICON_CACHE.get(path)
+    if icon is None:
+        icon = _ICON_CACHE[path] = QIcon(path)
+    return icon
+
+class DecoderSignals(QObject):
+    decoded = pyqtSignal(QImage)
+
+class ImageDecoder(QRunnable):
+    """Decode an image off the GUI thread; QImage, unlike QPixmap, is safe to build there."""
+    def __init__(self, source):
+        super().__init__()
+        self.source = source
+        self.signals = DecoderSignals()
+
+    def run(self):
+        # An exception escaping run() would abort the whole app, so report it as a
+        # failed decode (a null QImage) instead
+        try:
+            image = decode_image(self.source)
+        except Exception:
+            image = QImage()
+        self.source = None
+        try:
+            self.signals.decoded.emit(image)
+        except RuntimeError:
+            pass  # The viewer, and with it the signals object, was torn down meanwhile
+
+class ImageView(QGraphicsView):
+    def sizeHint(self):
+        return QSize(0, 0)
+
+    def minimumSizeHint(self):
+        return QSize(0, 0)
+
+@dataclass
+class ViewerConfig:
+    """What differs between the viewer apps; optional assets left as None are skipped."""
+    title: str
+    geometry: tuple  # (x, y, width, height)
+    logo_path: Optional[str] = None
+    icon_path: Optional[str] = None
+    font_path: Optional[str] = None
+    font_family: Optional[str] = None  # System font to fall back on if font_path can't be loaded
+    palette: dict = field(default_factory=dict)  # QPalette.ColorRole -> color name
+    stylesheet: str = ""  # Only for what the palette can't express (borders, radii, padding)
+
+def resource_path(*parts):
+    """Return the path of a bundled resource, inside the PyInstaller bundle when frozen."""
+    # Determine the base path
+    if hasattr(sys, '_MEIPASS'):
+        base_path = sys._MEIPASS
+    else:
+        base_path = os.path.abspath(".")
+    return os.path.join(base_path, *parts)
+
+def apply_font(config):
+    """Load and set the embedded font, falling back to the installed font family."""
+    font_family = config.font_family
+    if os.path.exists(config.font_path):
+        font_id = QFontDatabase.addApplicationFont(config.font_path)
+        if font_id == -1:
+            print(f"Failed to load the font from {config.font_path}.")
+        else:
+            font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
+    else:
+        print(f"Font file not found at {config.font_path}.")
+    if font_family:
+        QApplication.setFont(QFont(font_family, 14))
+
+class TextBasedImageViewer(QMainWindow):
+    def __init__(self, config):
+        super().__init__()
+
+        if config.font_path:
+            apply_font(config)
+
+        self.setWindowTitle(config.title)
+        if config.icon_path:
+            self.setWindowIcon(cached_icon(config.icon_path))
+        self.setGeometry(*config.geometry)
+        self.default_size = QSize(*config.geometry[2:])
+        self.setAcceptDrops(True)  # Enable drag-and-drop for the main window
+
+        # Plain colors go through the palette, which involves no style sheet parsing.
+        # Both are installed on the application (widget palettes don't propagate once a
+        # style sheet is active), so the style sheet is parsed once per process rather
+        # than once per window, and before any widget gets polished.
+        app = QApplication.instance()
+        palette = app.palette()
+        for role, color in config.palette.items():
+            palette.setColor(role, QColor(color))
+        if palette != app.palette():
+            app.setPalette(palette)
+        if app.styleSheet() != config.stylesheet:
+            app.setStyleSheet(config.stylesheet)
+
+        # Always-on-top state, and the window flags last applied. Tracking them lets
+        # reset_app skip toggle_on_top when the hint is already off; toggling still has
+        # to call setWindowFlags() and show(), which recreate the native window.
+        self.is_on_top = False
+        self._flags = self.windowFlags()
+
+        # The displayed image, capped to the maximum size
+        self.scaled_pixmap = None
+
+        # Shared network manager for image downloads, and the reply in flight. It keeps
+        # connections alive per host, so repeated loads from one site skip the handshake.
+        self.nam = QNetworkAccessManager(self)
+        self._reply = None
+        self._dl_buf = QByteArray()
+        self._dl_buf.reserve(DOWNLOAD_BUFFER_SIZE)
+
+        # Pending thread-pool decode, and whether it is only a preview. Decoding gets its own
+        # pool: Qt runs internal work on the global one (e.g. image format conversion) and
+        # waits for it while we hold the GIL, so a decoder queued there could deadlock.
+        self._decode_pool = QThreadPool(self)
+        self._decoder = None
+        self._decode_preview = False
+
+        # Coalesce bursts of resize events into a single smooth rescale; while
+        # the resize is live, frames are drawn with the cheaper fast transform
+        self._live_resizing = False
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(40)
+        self._resize_timer.timeout.connect(self.finish_resize)
+
+        # View size and pixmap the image was last fitted for, to skip no-op refits
+        self._last_view_size = QSize(-1, -1)
+        self._last_pixmap_key = None
+        self._fit_deferred = False
+
+        # Main layout
+        self.central_widget = QWidget()
+        self.setCentralWidget(self.central_widget)
+        self.layout = QVBoxLayout(self.central_widget)
+
+        # Logo at the top
+        if config.logo_path:
+            self.logo_label = QLabel()
+            self.logo_pixmap = cached_pixmap(config.logo_path)
+            self.logo_label.setPixmap(self.logo_pixmap)
+            self.logo_label.setAlignment(Qt.AlignCenter)
+            self.layout.addWidget(self.logo_label)
+
+        # Paste URL Input
+        self.url_input = QLineEdit()
+        self.url_input.setPlaceholderText("Paste Image URL")
+        self.layout.addWidget(self.url_input)
+
+        # Load Image Button
+        self.load_button = QPushButton("Load Image from URL")
+        self.load_button.clicked.connect(self.load_image_from_url)
+        self.layout.addWidget(self.load_button)
+
+        # Drag-and-Drop Image Area
+        # The image is a static pixmap item; fitting it to the view is a transform change,
+        # so resizing never allocates new pixel buffers
+        self.scene = QGraphicsScene(self)
+        self.pix_item = QGraphicsPixmapItem()
+        self.pix_item.setTransformationMode(Qt.SmoothTransformation)
+        self.scene.addItem(self.pix_item)
+        self.message_item = self.scene.addSimpleText("")
+        self.image_view = ImageView(self.scene)
+        self.image_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.image_view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        # Let drops fall through to the main window, which handles them
+        self.image_view.setAcceptDrops(False)
+        self.image_view.viewport().setAcceptDrops(False)
+        self.image_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.layout.addWidget(self.image_view)
+        self.show_message("Drag and Drop an Image Here")
+
+        # Reset Button (moved to bottom)
+        self.reset_button = QPushButton("Reset")
+        self.reset_button.clicked.connect(self.reset_app)
+        self.layout.addWidget(self.reset_button)
+
+        # Opacity Slider
+        self.opacity_slider = QSlider(Qt.Horizontal)
+        self.opacity_slider.setMinimum(10)
+        self.opacity_slider.setMaximum(100)
+        self.opacity_slider.setValue(100)
+        self.opacity_slider.setTickInterval(10)
+        self.opacity_slider.setTickPosition(QSlider.TicksBelow)
+        self.opacity_slider.valueChanged.connect(self.change_opacity)
+        self.layout.addWidget(self.opacity_slider)
+
+        # Label for Opacity Slider
+        self.opacity_label = QLabel("Window Opacity: 100%")
+        self.opacity_label.setAlignment(Qt.AlignCenter)
+        self.layout.addWidget(self.opacity_label)
+
+        # Toggle Always-on-Top Button
+        self.toggle_top_button = QPushButton("Toggle Always-on-Top")
+        self.toggle_top_button.clicked.connect(self.toggle_on_top)
+        self.layout.addWidget(self.toggle_top_button)
+
+        # The status text in the image area takes the view's text color
+        self.image_view.ensurePolished()
+        self.message_item.setBrush(self.image_view.palette().color(QPalette.Text))
+
+        # Auto-fetch URL from clipboard
+        self.auto_fetch_url_from_clipboard()
+
+    def load_image_from_url(self):
+        """Load an image from the URL entered in the text field."""
+        url = QUrl(self.url_input.text())
+        if url.isLocalFile():
+            self.load_image_from_file(url.toLocalFile())  # No need to go through the network stack
+            return
+        self.abort_download()
+        # Empty the shared buffer but keep its allocation. clear() would free it, while
+        # resize(0) keeps reserved capacity; reserve() restores it if a decoder copy
+        # still shared the old data and resize() had to detach.
+        self._dl_buf.resize(0)
+        self._dl_buf.reserve(DOWNLOAD_BUFFER_SIZE)
+        self.start_download(url, self._dl_buf)
+
+    def load_image_from_file(self, file_path):
+        """Load an image from a local file."""
+        self.abort_download()
+        self.decode_in_background(file_path)
+
+    def start_download(self, url, buf, offset=0):
+        """Download url into buf, starting at byte offset.
+
+        A fresh download (offset 0) only asks for the first PREVIEW_BYTES; the rest is
+        fetched by a follow-up request if it turns out to be needed.
+        """
+        request = QNetworkRequest(url)
+        request.setAttribute(QNetworkRequest.FollowRedirectsAttribute, True)
+        # Abort transfers that stall, so the reply finishes with an error instead of hanging
+        request.setTransferTimeout(TRANSFER_TIMEOUT_MS)
+        # Same-host follow-ups (the rest of a preview, more images from one CDN) can then
+        # share one multiplexed TLS connection
+        request.setAttribute(QNetworkRequest.Http2AllowedAttribute, True)
+        request.setHeader(QNetworkRequest.UserAgentHeader, USER_AGENT)
+        if offset:
+            request.setRawHeader(b"Range", f"bytes={offset}-".encode())
+        else:
+            request.setRawHeader(b"Range", f"bytes=0-{PREVIEW_BYTES - 1}".encode())
+        reply = self.nam.get(request)
+        self._reply = reply
+
+        # Stream the body into the QByteArray as it arrives, decode once finished
+        reply.readyRead.connect(lambda: buf.append(reply.readAll()))
+        reply.finished.connect(lambda: self.on_image_downloaded(reply, buf, offset))
+
+    def on_image_downloaded(self, reply, buf, offset):
+        """Decode a finished download and display it, fetching the rest of the file if needed."""
+        reply.deleteLater()
+        if reply is not self._reply:
+            return  # Superseded by a newer download or a reset
+        self._reply = None
+
+        if reply.error() == QNetworkReply.OperationCanceledError:
+            # Our own aborts are filtered out above, so this is the transfer timeout
+            self.show_message("Error loading image: the server stopped responding")
+            return
+        if reply.error() != QNetworkReply.NoError:
+            self.show_message(f"Error loading image: {reply.errorString()}")
+            return
+
+        buf.append(reply.readAll())
+        if reply.attribute(QNetworkRequest.HttpStatusCodeAttribute) == 206:
+            total = content_range_total(reply)
+            if offset == 0 and (total is None or total > buf.size()):
+                # Only the first PREVIEW_BYTES arrived. For large files these are shown
+                # as a first frame (progressive JPEGs render the whole frame at lower
+                # quality) while the rest downloads; the full decode then replaces it.
+                if total is not None and total > PREVIEW_THRESHOLD:
+                    self.decode_in_background(buf, preview=True)
+                self.start_download(reply.url(), buf, buf.size())
+                return
+        elif offset:
+            buf.remove(0, offset)  # The server ignored the Range header and resent the whole file
+
+        self.decode_in_background(buf)
+
+    def decode_in_background(self, source, preview=False):
+        """Decode image bytes or a file path on the thread pool, then display the result.
+
+        A preview that can't be decoded is dropped silently, since the full image follows.
+        """
+        if isinstance(source, QByteArray):
+            # Hand over an implicitly shared copy, so the next download into the reused
+            # buffer detaches from it instead of changing the bytes under the decoder
+            source = QByteArray(source)
+        decoder = ImageDecoder(source)
+        decoder.signals.decoded.connect(self.on_image_decoded)
+        self._decoder = decoder
+        self._decode_preview = preview
+        self._decode_pool.start(decoder)
+
+    def on_image_decoded(self, image):
+        """Display an image decoded by the thread pool."""
+        if self._decoder is None or self.sender() is not self._decoder.signals:
+            return  # Superseded by a newer load or a reset
+        self._decoder = None
+
+        if image.isNull():
+            if not self._decode_preview:
+                self.show_message("Error loading image: unsupported image data")
+            return
+
+        # Only this conversion needs the GUI thread
+        self.set_image(QPixmap.fromImage(image))
+
+    def abort_download(self):
+        """Cancel the download or decode in flight, if any."""
+        self._decoder = None
+        if self._reply is not None:
+            reply, self._reply = self._reply, None
+            reply.abort()
+
+    def set_image(self, pixmap):
+        """Store a newly loaded image, cap it to the maximum size once, and display it."""
+        # Maximum size for the image
+        max_size = QSize(800, 800)
+
+        # Scale the original pixmap to fit within maximum size, maintaining aspect ratio.
+        # This only depends on the image, so it is done once per load rather than per resize.
+        if (pixmap.width() > max_size.width() or
+                pixmap.height() > max_size.height()):
+            # The limiting axis is known here, so scale along it directly instead of
+            # going through the two-axis KeepAspectRatio fit
+            if pixmap.width() * max_size.height() >= pixmap.height() * max_size.width():
+                self.scaled_pixmap = pixmap.scaledToWidth(max_size.width(), Qt.SmoothTransformation)
+            else:
+                self.scaled_pixmap = pixmap.scaledToHeight(max_size.height(), Qt.SmoothTransformation)
+        else:
+            self.scaled_pixmap = pixmap
+
+        # Update the image display
+        self.message_item.hide()
+        self.show_pixmap(self.scaled_pixmap)
+        self.pix_item.show()
+        self.update_image()
+
+    def show_pixmap(self, pixmap):
+        """Put pixmap on the image item, unless it is already showing it."""
+        if self.pix_item.pixmap().cacheKey() != pixmap.cacheKey():
+            self.pix_item.setPixmap(pixmap)
+            self.scene.setSceneRect(self.pix_item.boundingRect())
+
+    def show_message(self, text):
+        """Show a text message in the image area in place of the image."""
+        self.pix_item.hide()
+        self.message_item.setText(text)
+        self.message_item.show()
+        self.scene.setSceneRect(self.message_item.boundingRect())
+        self.image_view.resetTransform()
+        self._last_pixmap_key = None
+
+    def update_image(self):
+        """Update the displayed image, fitting the size-capped pixmap to the view."""
+        if self.scaled_pixmap is None or not self.pix_item.isVisible():
+            return
+
+        view_size = self.image_view.viewport().size()
+        if view_size.width() <= 1 or view_size.height() <= 1:
+            # The layout hasn't given the view its size yet (e.g. on first show), so a fit
+            # now would only be redone once it has. Retry once on the next event-loop turn;
+            # past that, the resize that gives the view its size triggers the fit.
+            if not self._fit_deferred:
+                self._fit_deferred = True
+                QTimer.singleShot(0, self.update_image)
+            return
+        self._fit_deferred = False
+
+        # Fit the pixmap within the view's size, maintaining aspect ratio
+        mode = Qt.FastTransformation if self._live_resizing else Qt.SmoothTransformation
+        pixmap_key = self.scaled_pixmap.cacheKey()
+        if (view_size == self._last_view_size and pixmap_key == self._last_pixmap_key and
+                mode == self.pix_item.transformationMode()):
+            return
+        self.pix_item.setTransformationMode(mode)
+        # fitInView leaves a 2px margin on each side; fit the pre-scaled copy to the same area
+        fit_area = self.image_view.viewport().rect().adjusted(2, 2, -2, -2).size()
+        fit_size = self.scaled_pixmap.size().scaled(fit_area, Qt.KeepAspectRatio)
+        if mode == Qt.SmoothTransformation and fit_size.width() * 2 < self.scaled_pixmap.width():
+            # The view transform samples bilinearly, which aliases on downscales beyond 2x.
+            # Once the resize has settled, show an area-averaged copy at 1:1 instead.
+            self.show_pixmap(self.scaled_pixmap.scaled(
+                fit_size, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            self.image_view.resetTransform()
+        else:
+            self.show_pixmap(self.scaled_pixmap)
+            self.image_view.fitInView(self.pix_item, Qt.KeepAspectRatio)
+        self._last_view_size = view_size
+        self._last_pixmap_key = pixmap_key
+
+    def resizeEvent(self, event):
+        """Handle window resizing, with a fast rescale now and a smooth one once it settles."""
+        super().resizeEvent(event)
+        self._live_resizing = True
+        self.update_image()
+        self._resize_timer.start()
+
+    def finish_resize(self):
+        """Redraw the image with smooth scaling after the resize has settled."""
+        self._live_resizing = False
+        self.update_image()
+
+    def change_opacity(self):
+        """Change the window opacity based on the slider value."""
+        value = self.opacity_slider.value()
+        opacity = value / 100.0  # Convert to a float between 0.1 and 1.0
+        self.setWindowOpacity(opacity)
+        self.opacity_label.setText(f"Window Opacity: {value}%")
+
+    def toggle_on_top(self):
+        """Toggle the always-on-top state of the window."""
+        self._flags ^= Qt.WindowStaysOnTopHint
+        self.is_on_top = not self.is_on_top
+        if self.is_on_top:
+            self.toggle_top_button.setText("Toggle Always-on-Top (ON)")
+        else:
+            self.toggle_top_button.setText("Toggle Always-on-Top (OFF)")
+        self.setWindowFlags(self._flags)
+        self.show()  # Reapply window flags
+
+    def auto_fetch_url_from_clipboard(self):
+        """Automatically fetch and load an image URL from the clipboard."""
+        clipboard = QGuiApplication.clipboard()
+        url = clipboard.text()
+        try:
+            parts = urlsplit(url)
+        except ValueError:
+            return  # Not URL-shaped, e.g. an unbalanced "[" in arbitrary clipboard text
+        if not parts.path.lower().endswith(IMAGE_EXTENSIONS):
+            return
+        # Anything else would only fail after a pointless network attempt
+        if parts.scheme not in ("http", "https", "file"):
+            return
+        self.url_input.setText(url)
+        self.load_image_from_url()
+
+    def reset_app(self):
+        """Reset the application to its default state."""
+        self.abort_download()
+        self.url_input.clear()
+        self.show_message("Drag and Drop an Image Here")
+        self.scaled_pixmap = None
+        if self.is_on_top:
+            self.toggle_on_top()  # Reset always-on-top; only needed when it is on
+        self.resize(self.default_size)  # Reset to default size
+        self.setWindowOpacity(1.0)  # Reset opacity to 100%
+        self.opacity_slider.setValue(100)
+        self.opacity_label.setText("Window Opacity: 100%")
+
+    def dragEnterEvent(self, event):
+        """Allow drag events if they contain files."""
+        if event.mimeData().hasUrls():
+            event.accept()
+        else:
+            event.ignore()
+
+    def dropEvent(self, event):
+        """Handle file drops."""
+        file_path = event.mimeData().urls()[0].toLocalFile()
+        self.load_image_from_file(file_path)
+
+    def closeEvent(self, event):
+        """Stop pending work before the window is torn down."""
+        self.abort_download()
+        # Drop queued decodes and let the running one finish while the viewer still exists
+        self._decode_pool.clear()
+        self._decode_pool.waitForDone()
+        super().closeEvent(event)
+
+def run(config):
+    """Start the application with a single viewer window."""
+    app = QApplication(sys.argv)
+    viewer = TextBasedImageViewer(config)
+    viewer.show()
+    sys.exit(app.exec_())